@@ -0,0 +1,37 @@
+import click
+
+from lhotse.bin.modes import prepare
+from lhotse.recipes.uniphore_dev import prepare_uniphore_dev
+from lhotse.utils import Pathlike
+
+__all__ = ["uniphore_dev"]
+
+
+@prepare.command(context_settings=dict(show_default=True))
+@click.argument("corpus_dir", type=click.Path(exists=True, dir_okay=True))
+@click.argument("output_dir", type=click.Path())
+@click.option(
+    "--normalize-text/--no-normalize-text",
+    default=False,
+    help="Lowercase the transcripts and remove punctuation.",
+)
+@click.option(
+    "--validate/--no-validate",
+    default=True,
+    help="Cross-check the supervisions against the recordings.",
+)
+def uniphore_dev(
+    corpus_dir: Pathlike, output_dir: Pathlike, normalize_text: bool, validate: bool
+):
+    """
+    Uniphore development data preparation.
+
+    Prepares the manifests for the two-channel call center conversations
+    shared by Uniphore (banking, healthcare and insurance subsets).
+    """
+    prepare_uniphore_dev(
+        corpus_dir,
+        output_dir=output_dir,
+        normalize_text=normalize_text,
+        validate=validate,
+    )
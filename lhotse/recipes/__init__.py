@@ -31,5 +31,6 @@ from .nsc import prepare_nsc
 from .switchboard import prepare_switchboard
 from .tedlium import download_tedlium, prepare_tedlium
 from .timit import download_timit, prepare_timit
+from .uniphore_dev import prepare_uniphore_dev
 from .vctk import download_vctk, prepare_vctk
 from .yesno import download_yesno, prepare_yesno
@@ -2,6 +2,7 @@ import gzip
 import itertools
 import json
 import warnings
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Generator, Iterable, Optional, Type, Union
 
@@ -9,6 +10,11 @@ import yaml
 
 from lhotse.utils import Pathlike
 
+# Writing with the default gzip compression level (9) is very CPU-heavy and
+# tends to dominate the manifest saving time; level 1 compresses several times
+# faster at only a slightly worse ratio. Reading is unaffected.
+gzip_open_fast = partial(gzip.open, compresslevel=1)
+
 # TODO: figure out how to use some sort of typing stubs
 #  so that linters/static checkers don't complain
 Manifest = Any  # Union['RecordingSet', 'SupervisionSet', 'FeatureSet', 'CutSet']
@@ -16,7 +22,7 @@ Manifest = Any  # Union['RecordingSet', 'SupervisionSet', 'FeatureSet', 'CutSet'
 
 def save_to_yaml(data: Any, path: Pathlike) -> None:
     compressed = str(path).endswith(".gz")
-    opener = gzip.open if compressed else open
+    opener = gzip_open_fast if compressed else open
     mode = "wt" if compressed else "w"
     with opener(path, mode) as f:
         try:
@@ -49,7 +55,7 @@ class YamlMixin:
 def save_to_json(data: Any, path: Pathlike) -> None:
     """Save the data to a JSON file. Will use GZip to compress it if the path ends with a ``.gz`` extension."""
     compressed = str(path).endswith(".gz")
-    opener = gzip.open if compressed else open
+    opener = gzip_open_fast if compressed else open
     mode = "wt" if compressed else "w"
     with opener(path, mode) as f:
         json.dump(data, f, indent=2)
@@ -75,7 +81,7 @@ class JsonMixin:
 def save_to_jsonl(data: Iterable[Dict[str, Any]], path: Pathlike) -> None:
     """Save the data to a JSON file. Will use GZip to compress it if the path ends with a ``.gz`` extension."""
     compressed = str(path).endswith(".gz")
-    opener = gzip.open if compressed else open
+    opener = gzip_open_fast if compressed else open
     mode = "wt" if compressed else "w"
     with opener(path, mode) as f:
         for item in data:
@@ -131,7 +137,7 @@ class SequentialJsonlWriter:
         self.path = Path(path)
         assert extension_contains(".jsonl", self.path)
         self.compressed = extension_contains(".gz", self.path)
-        self._open = gzip.open if self.compressed else open
+        self._open = gzip_open_fast if self.compressed else open
         self.mode = "wt" if self.compressed else "w"
         self.ignore_ids = set()
         if self.path.is_file() and not overwrite:
@@ -0,0 +1,53 @@
+import pytest
+
+from lhotse.recipes import uniphore_dev
+from lhotse.recipes.uniphore_dev import parse_tsv_file
+from lhotse.utils import is_module_available
+
+# Two rows of a combined.tsv file: one segment per conversation side.
+_ROW1 = [
+    "utt0001",
+    "call0001",
+    "1",
+    "00:00:01.500",
+    "00:00:03.000",
+    "00:00:01.500",
+    "Hello, there!",
+    "spk1",
+    "M",
+    "30",
+    "US",
+    "us",
+    "agent",
+    "spk2",
+    "F",
+    "40",
+    "US",
+    "us",
+    "customer",
+]
+_ROW2 = (
+    _ROW1[:2] + ["2", "00:00:03.200", "00:00:04.000", "00:00:00.800", "Hi."] + _ROW1[7:]
+)
+
+_EXPECTED_COLUMNS = [list(column) for column in zip(_ROW1, _ROW2)]
+
+
+@pytest.fixture(params=["\n", "\r\n"])
+def tsv_path(tmp_path, request):
+    newline = request.param
+    header = "\t".join(f"col{i}" for i in range(len(_ROW1)))
+    path = tmp_path / "combined.tsv"
+    lines = [header, "\t".join(_ROW1), "\t".join(_ROW2), ""]
+    path.write_bytes(newline.join(lines).encode("utf-8"))
+    return path
+
+
+def test_parse_tsv_file_without_pyarrow(tsv_path, monkeypatch):
+    monkeypatch.setattr(uniphore_dev, "is_module_available", lambda *modules: False)
+    assert parse_tsv_file(tsv_path) == _EXPECTED_COLUMNS
+
+
+@pytest.mark.skipif(not is_module_available("pyarrow"), reason="Requires pyarrow")
+def test_parse_tsv_file_with_pyarrow(tsv_path):
+    assert parse_tsv_file(tsv_path) == _EXPECTED_COLUMNS